@@ -5,11 +5,14 @@ and serves a black, landscape-friendly webpage showing live stats.
 Usage (PowerShell):
   - Place LibreHardwareMonitorLib.dll in the same directory as this script, or set env var LHM_DLL_PATH to its full path.
   - Install dependencies:  py -m pip install "Django>=4.2,<5.3" "pythonnet>=3.0,<4"
+  - Optional (faster JSON): py -m pip install orjson
   - Run server:            py .\monitor_server.py --host 0.0.0.0 --port 8000
 
 Notes:
   - Access the UI at http://<host>:<port>/
   - JSON metrics at http://<host>:<port>/api/metrics
+  - Binary metrics at http://<host>:<port>/api/metrics.bin (little-endian float64 per tile in METRICS_BIN_KEYS order, NaN = no reading)
+  - Live metrics (Server-Sent Events) at http://<host>:<port>/api/metrics/stream
   - Requires Windows with .NET Framework available (pythonnet) and LibreHardwareMonitorLib.dll.
 """
 
@@ -18,12 +21,19 @@ import os
 import sys
 import ctypes
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 import json
 import configparser
+import gzip
+import hashlib
 import subprocess
 import socket
+import struct
 import ssl
+from array import array
+from math import isfinite
+from statistics import fmean
+import threading
 
 def is_admin():
     try:
@@ -45,6 +55,107 @@ print("Running with admin privileges!")
 
 
 # --- Hardware Monitor integration (LibreHardwareMonitor via pythonnet) ---
+# (parent_hardware_type, sensor_type, lowercased_name, name_tags, sensor); enum members as ints
+SensorRecord = Tuple[Optional[int], Optional[int], str, int, Any]
+
+# Sensor name tags, computed once per sensor so per-frame checks are a single bitwise AND
+TAG_CCD = 1 << 0
+TAG_CORE = 1 << 1
+TAG_CPU_LABEL = 1 << 2
+TAG_TOTAL_LOAD = 1 << 3
+TAG_CORE_CLOCK = 1 << 4
+TAG_CPU_POWER = 1 << 5
+TAG_VIRTUAL = 1 << 6
+TAG_USED = 1 << 7
+TAG_FREE = 1 << 8
+TAG_RAM_LOAD = 1 << 9
+TAG_HOTSPOT = 1 << 10
+TAG_GPU_LOAD = 1 << 11
+TAG_MEMORY = 1 << 12
+
+_NAME_TAG_RULES: List[Tuple[int, Callable[[str], bool]]] = [
+    (TAG_CCD, lambda n: "ccd" in n),
+    (TAG_CORE, lambda n: "core" in n),
+    (TAG_CPU_LABEL, lambda n: any(k in n for k in ("package", "tdie", "tctl", "cpu"))),
+    (TAG_TOTAL_LOAD, lambda n: n.strip() in ("cpu total", "total")),
+    (TAG_CORE_CLOCK, lambda n: n.startswith("cpu core") or n.startswith("core") or "clock" in n),
+    (TAG_CPU_POWER, lambda n: any(k in n for k in ("package", "cpu", "ppt", "socket", "total"))),
+    (TAG_VIRTUAL, lambda n: "virtual" in n),
+    (TAG_USED, lambda n: "used" in n),
+    (TAG_FREE, lambda n: "available" in n or "free" in n),
+    (TAG_RAM_LOAD, lambda n: any(k in n for k in ("memory", "ram", "load", "usage"))),
+    (TAG_HOTSPOT, lambda n: any(k in n for k in ("hot spot", "hotspot", "junction"))),
+    (TAG_GPU_LOAD, lambda n: "core" in n or n in ("gpu core", "gpu")),
+    (TAG_MEMORY, lambda n: "memory" in n),
+]
+
+
+def _name_tags(name: str) -> int:
+    tags = 0
+    for tag, matches in _NAME_TAG_RULES:
+        if matches(name):
+            tags |= tag
+    return tags
+
+
+# Compiled at startup by HardwareMonitorReader._build_gather; missing values become NaN
+_GATHER_SOURCE = """
+using LibreHardwareMonitor.Hardware;
+
+public static class LHMBridge
+{
+    public static void Gather(ISensor[] sensors, float[] values)
+    {
+        for (int i = 0; i < sensors.Length; i++)
+        {
+            float? v = sensors[i].Value;
+            values[i] = v.HasValue ? v.Value : float.NaN;
+        }
+    }
+}
+"""
+
+
+class _HardwareUpdater:
+    """Long-lived daemon worker that runs one device's Update() each time it is signalled.
+
+    Daemon, so a driver call that never returns cannot block interpreter exit.
+    """
+
+    def __init__(self, hardware: Any, update: Callable[[Any], None]) -> None:
+        self.hardware = hardware
+        self._update = update
+        self._wake = threading.Event()
+        self._retired = False
+        # Set while idle; cleared from request() until the Update() it triggered returns
+        self.done = threading.Event()
+        self.done.set()
+        threading.Thread(target=self._run, name="lhm-update", daemon=True).start()
+
+    def request(self) -> bool:
+        # False while the previous Update() is still stuck in a driver call
+        if not self.done.is_set():
+            return False
+        self.done.clear()
+        self._wake.set()
+        return True
+
+    def retire(self) -> None:
+        self._retired = True
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._retired:
+                return
+            try:
+                self._update(self.hardware)
+            finally:
+                self.done.set()
+
+
 class HardwareMonitorReader:
     def __init__(self, dll_path: Optional[str] = None) -> None:
         self._load_monitor_lib(dll_path)
@@ -74,22 +185,66 @@ class HardwareMonitorReader:
 
         self.computer.Open()
 
-        # Use manual updates in _update_all; pythonnet proxying IVisitor can be unreliable
+        # Use manual updates in _update_all; pythonnet proxying IVisitor can be unreliable.
+        # Update() blocks on SMBus/MSR/WMI I/O, so each device is refreshed on its own thread.
+        self._hardware: List[Any] = list(getattr(self.computer, "Hardware", []) or [])
+        self._hardware_keys: List[str] = [self._hardware_key(h) for h in self._hardware]
+        # One update worker per hardware identifier; a stuck device is not re-signalled until it returns
+        self._updaters: Dict[str, _HardwareUpdater] = {}
+        self._sync_updaters()
 
         # Enums and types cached for faster attribute access
         self.HardwareType = LHMHardware.HardwareType  # type: ignore
         self.SensorType = LHMHardware.SensorType  # type: ignore
 
-        # Cache common enum members with cross-name compatibility
-        self.HT_CPU = getattr(self.HardwareType, "Cpu", None) or getattr(self.HardwareType, "CPU", None)
-        self.HT_MAINBOARD = getattr(self.HardwareType, "Mainboard", None) or getattr(self.HardwareType, "Motherboard", None)
-        self.HT_RAM = getattr(self.HardwareType, "Memory", None) or getattr(self.HardwareType, "RAM", None)
-        self.HT_NETWORK = getattr(self.HardwareType, "Network", None)
-        self.ST_TEMP = getattr(self.SensorType, "Temperature", None)
-        self.ST_LOAD = getattr(self.SensorType, "Load", None)
-        self.ST_CLOCK = getattr(self.SensorType, "Clock", None)
-        self.ST_POWER = getattr(self.SensorType, "Power", None)
-        self.ST_DATA = getattr(self.SensorType, "Data", None)
+        # Cache common enum members with cross-name compatibility (as plain ints)
+        self.HT_CPU = self._enum_int(getattr(self.HardwareType, "Cpu", None) or getattr(self.HardwareType, "CPU", None))
+        self.HT_MAINBOARD = self._enum_int(getattr(self.HardwareType, "Mainboard", None) or getattr(self.HardwareType, "Motherboard", None))
+        self.HT_RAM = self._enum_int(getattr(self.HardwareType, "Memory", None) or getattr(self.HardwareType, "RAM", None))
+        self.HT_NETWORK = self._enum_int(getattr(self.HardwareType, "Network", None))
+        self._ram_ht_set: FrozenSet[int] = self._hardware_type_set("RAM", "Memory")
+        self._gpu_ht_set: FrozenSet[int] = self._hardware_type_set(
+            "GpuNvidia", "GpuAti", "GpuAmd", "GpuAmdRadeon", "GpuIntel"
+        )
+        self.ST_TEMP = self._sensor_type_int("Temperature")
+        self.ST_LOAD = self._sensor_type_int("Load")
+        self.ST_CLOCK = self._sensor_type_int("Clock")
+        self.ST_POWER = self._sensor_type_int("Power")
+        self.ST_DATA = self._sensor_type_int("Data")
+
+        # Hardware can come and go at runtime (NIC reconnect, VPN adapters), and LHM activates
+        # sensors from inside Update(); it raises HardwareAdded/Removed and SensorAdded/Removed,
+        # and a slow rescan covers builds where subscribing fails
+        self._hardware_changed = False
+        self._sensor_watched: Set[str] = set()
+        self._sensor_set: Tuple[str, ...] = ()
+        self._rescan_period = 30.0
+        self._last_rescan = time.monotonic()
+        try:
+            self.computer.HardwareAdded += self._on_hardware_changed
+            self.computer.HardwareRemoved += self._on_hardware_changed
+        except Exception:
+            pass
+
+        # Unboxed float buffers filled by a single classification pass per frame
+        self._buckets: Dict[str, "array[float]"] = {
+            key: array("d") for key in (
+                "cpu_ccd_temp", "cpu_core_temp", "cpu_package_temp", "mb_cpu_temp",
+                "cpu_total_load", "cpu_load", "cpu_clock", "cpu_power",
+                "ram_used", "ram_free", "ram_load",
+                "gpu_temp", "gpu_hotspot_temp", "gpu_load", "gpu_power", "gpu_core_clock", "gpu_mem_clock",
+                "net_load",
+            )
+        }
+        self._dispatch = self._build_dispatch()
+        self._lhm_hardware = LHMHardware
+        self._sensor_records: List[SensorRecord] = []
+        self._routed_handlers: List[Tuple[Callable[[int, Any], None], int]] = []
+        self._routed_sensors: List[Any] = []
+        self._gather: Optional[Callable[[], Sequence[float]]] = None
+        self._gather_method = self._compile_gather(LHMHardware)
+        self._update_all()
+        self._build_routes()
 
     def _load_monitor_lib(self, dll_path: Optional[str]) -> None:
         # Load the LibreHardwareMonitor assembly following the simplest working approach
@@ -101,6 +256,18 @@ class HardwareMonitorReader:
                 "pythonnet (clr) is required. Install with: py -m pip install pythonnet"
             ) from exc
 
+        # Reuse the DLL path resolved on a previous start unless one is given explicitly
+        cached_path = UI_CONFIG.get("lhm_dll_path")
+        if cached_path and not dll_path and not os.environ.get("LHM_DLL_PATH"):
+            try:
+                if os.path.isfile(cached_path):
+                    self._add_dll_directories([cached_path])
+                    clr.AddReference(cached_path)  # type: ignore
+                    return
+            except Exception:
+                # Stale or broken cache entry; fall back to the full search below
+                pass
+
         candidate_paths: List[str] = []
         if dll_path:
             candidate_paths.append(dll_path)
@@ -117,24 +284,11 @@ class HardwareMonitorReader:
         except Exception:
             pass
 
-        # Help Windows locate dependent DLLs by augmenting DLL search paths (Python 3.8+)
-        try:
-            add_dir = getattr(os, "add_dll_directory", None)
-            if add_dir:
-                seen_dirs: List[str] = []
-                for p in list(candidate_paths):
-                    directory = p if os.path.isdir(p) else os.path.dirname(p)
-                    if directory and os.path.isdir(directory) and directory not in seen_dirs:
-                        try:
-                            add_dir(directory)
-                            seen_dirs.append(directory)
-                        except Exception:
-                            pass
-        except Exception:
-            pass
+        self._add_dll_directories(candidate_paths)
 
         # Load LibreHardwareMonitorLib only (as in the working minimal example)
         loaded = False
+        loaded_path: Optional[str] = None
         last_error: Optional[BaseException] = None
         # Try explicit file paths first
         for path in candidate_paths:
@@ -148,6 +302,7 @@ class HardwareMonitorReader:
                 if os.path.exists(dll_full):
                     clr.AddReference(dll_full)  # type: ignore
                     loaded = True
+                    loaded_path = os.path.abspath(dll_full)
                     break
             except Exception as exc:  # pragma: no cover - best-effort loading
                 last_error = exc
@@ -167,292 +322,414 @@ class HardwareMonitorReader:
             )
             raise FileNotFoundError(hint) from last_error
 
-    def _update_all(self) -> None:
-        # Ensure hardware and sub-hardware sensors are refreshed (manual traversal)
-        for hardware in getattr(self.computer, "Hardware", []) or []:
+        if loaded_path and loaded_path != cached_path:
             try:
-                hardware.Update()
+                save_ui_config(lhm_dll_path=loaded_path)
             except Exception:
-                continue
-            for sub in getattr(hardware, "SubHardware", []) or []:
-                try:
-                    sub.Update()
-                except Exception:
-                    continue
-
-    def _collect_sensors(self) -> List[Tuple[Any, Any, Any]]:
-        # Returns list of (hardware, sensor, parent_hardware)
-        sensors: List[Tuple[Any, Any, Any]] = []
-        for hardware in self.computer.Hardware:
-            for sensor in getattr(hardware, "Sensors", []) or []:
-                sensors.append((hardware, sensor, hardware))
-            for sub in getattr(hardware, "SubHardware", []) or []:
-                for sensor in getattr(sub, "Sensors", []) or []:
-                    sensors.append((sub, sensor, hardware))
-        return sensors
+                pass
 
     @staticmethod
-    def _is_finite(value: Optional[float]) -> bool:
-        if value is None:
-            return False
+    def _add_dll_directories(paths: List[str]) -> None:
+        # Help Windows locate dependent DLLs by augmenting DLL search paths (Python 3.8+)
+        try:
+            add_dir = getattr(os, "add_dll_directory", None)
+            if add_dir:
+                # Directories already on PATH are searched anyway
+                seen_dirs = {
+                    os.path.normcase(os.path.abspath(d))
+                    for d in os.environ.get("PATH", "").split(os.pathsep) if d
+                }
+                for p in list(paths):
+                    directory = p if os.path.isdir(p) else os.path.dirname(p)
+                    if not directory:
+                        continue
+                    key = os.path.normcase(os.path.abspath(directory))
+                    if key not in seen_dirs and os.path.isdir(directory):
+                        try:
+                            add_dir(directory)
+                            seen_dirs.add(key)
+                        except Exception:
+                            pass
+        except Exception:
+            pass
+
+    @staticmethod
+    def _hardware_key(hardware: Any) -> str:
         try:
-            import math
-            v = float(value)
-            return math.isfinite(v)
+            return str(hardware.Identifier)
         except Exception:
-            return False
+            return str(id(hardware))
+
+    def _on_hardware_changed(self, *_args: Any) -> None:
+        # Raised on an LHM thread; the refresh thread picks the flag up before its next update
+        self._hardware_changed = True
+
+    def _all_hardware(self) -> Iterator[Any]:
+        for hardware in self._hardware:
+            yield hardware
+            yield from getattr(hardware, "SubHardware", []) or []
+
+    def _sensor_signature(self) -> Tuple[str, ...]:
+        # Identifiers of every sensor currently exposed; compared on rescans to spot activations
+        return tuple(
+            str(sensor.Identifier)
+            for hardware in self._all_hardware()
+            for sensor in getattr(hardware, "Sensors", []) or []
+        )
+
+    def _watch_sensors(self) -> None:
+        for hardware in self._all_hardware():
+            key = self._hardware_key(hardware)
+            if key in self._sensor_watched:
+                continue
+            try:
+                hardware.SensorAdded += self._on_hardware_changed
+                hardware.SensorRemoved += self._on_hardware_changed
+            except Exception:
+                pass
+            self._sensor_watched.add(key)
+
+    def _build_routes(self) -> None:
+        # Sensor metadata (hardware type, sensor type, name) is fixed per sensor, so it is read
+        # once per hardware and sensor set and each frame only crosses into .NET for sensor.Value.
+        self._sensor_records = self._collect_sensors()
+        self._sensor_set = self._sensor_signature()
+        self._watch_sensors()
+        # Only sensors that feed a bucket are read each frame; handlers and sensors kept in parallel
+        routed = [
+            (self._dispatch[(ht, st)], tags, sensor)
+            for ht, st, _name, tags, sensor in self._sensor_records
+            if (ht, st) in self._dispatch
+        ]
+        self._routed_handlers = [(h, t) for h, t, _s in routed]
+        self._routed_sensors = [sensor for _h, _t, sensor in routed]
+        self._gather = self._build_gather(self._routed_sensors)
+
+    def _refresh_hardware(self, now: float, update_timeout: Optional[float] = None) -> None:
+        # Rebuild the cached hardware list and sensor routes when the set of devices or sensors changed
+        if not self._hardware_changed and now - self._last_rescan < self._rescan_period:
+            return
+        self._hardware_changed = False
+        self._last_rescan = now
+        hardware = list(getattr(self.computer, "Hardware", []) or [])
+        keys = [self._hardware_key(h) for h in hardware]
+        if keys != self._hardware_keys:
+            self._hardware = hardware
+            self._hardware_keys = keys
+            self._sync_updaters()
+            # New devices need one Update() before their sensors are populated; a hot-plugged
+            # adapter stuck in WMI must not hold the refresh thread longer than a normal frame
+            self._update_all(timeout=update_timeout)
+        elif self._sensor_signature() == self._sensor_set:
+            return
+        self._build_routes()
+
+    def _sync_updaters(self) -> None:
+        # Keep workers for devices still present, start one per new device, retire the rest
+        updaters: Dict[str, _HardwareUpdater] = {}
+        for key, hardware in zip(self._hardware_keys, self._hardware):
+            updater = self._updaters.pop(key, None)
+            updaters[key] = updater if updater is not None else _HardwareUpdater(hardware, self._update_hardware)
+        for gone in self._updaters.values():
+            gone.retire()
+        self._updaters = updaters
 
-    def _select_cpu_temps(self, sensors: List[Tuple[Any, Any, Any]]) -> Tuple[Optional[float], Optional[float]]:
-        core_sensor_temps: List[float] = []
-        ccd_sensor_temps: List[float] = []
-        package_temps: List[float] = []
-        mb_cpu_temps: List[float] = []
-        for _hw, sensor, parent in sensors:
-            if (self.ST_TEMP is not None and sensor.SensorType != self.ST_TEMP):
+    @staticmethod
+    def _update_hardware(hardware: Any) -> None:
+        try:
+            hardware.Update()
+        except Exception:
+            return
+        for sub in getattr(hardware, "SubHardware", []) or []:
+            try:
+                sub.Update()
+            except Exception:
                 continue
-            name = (sensor.Name or "").lower()
-            # CPU hardware temps
-            if getattr(parent, "HardwareType", None) == self.HT_CPU:
-                if "ccd" in name:
-                    if self._is_finite(sensor.Value):
-                        ccd_sensor_temps.append(float(sensor.Value))
-                elif "core" in name:
-                    if self._is_finite(sensor.Value):
-                        core_sensor_temps.append(float(sensor.Value))
-                elif any(k in name for k in ("package", "tdie", "tctl", "cpu")):
-                    if self._is_finite(sensor.Value):
-                        package_temps.append(float(sensor.Value))
-            # Some boards expose CPU temp under mainboard/superIO
-            elif getattr(parent, "HardwareType", None) == self.HT_MAINBOARD:
-                if any(k in name for k in ("cpu", "cpu socket", "package", "tdie", "tctl")):
-                    if self._is_finite(sensor.Value):
-                        mb_cpu_temps.append(float(sensor.Value))
 
-        # Hotspot: max core sensor, fallback to package, then mainboard
-        hotspot: Optional[float] = None
-        if core_sensor_temps:
-            hotspot = max(core_sensor_temps)
-        elif package_temps:
-            hotspot = max(package_temps)
-        elif mb_cpu_temps:
-            hotspot = max(mb_cpu_temps)
+    def _update_all(self, timeout: Optional[float] = None) -> None:
+        # Ensure hardware and sub-hardware sensors are refreshed (manual traversal);
+        # total wall time is the slowest device rather than the sum of all of them
+        requested = [updater.done for updater in self._updaters.values() if updater.request()]
+        # Laggards are not cancelled (native calls cannot be interrupted); they just stop blocking the frame
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for done in requested:
+            done.wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
 
-        # Core temp: average of CCDs if present, else average of cores, else package/mainboard
-        core_avg: Optional[float] = None
-        vals: List[float] = []
-        if ccd_sensor_temps:
-            vals = ccd_sensor_temps
-        elif core_sensor_temps:
-            vals = core_sensor_temps
-        elif package_temps:
-            vals = package_temps
-        elif mb_cpu_temps:
-            vals = mb_cpu_temps
-        if vals:
-            core_avg = sum(vals) / len(vals)
-        return core_avg, hotspot
-
-    def _select_cpu_total_load(self, sensors: List[Tuple[Any, Any, Any]]) -> Optional[float]:
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) == self.HT_CPU and (self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD):
-                if (sensor.Name or "").strip().lower() in ("cpu total", "total"):  # common names
-                    if self._is_finite(sensor.Value):
-                        return float(sensor.Value)
-        # Fallback: average all CPU load sensors
-        loads: List[float] = []
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) == self.HT_CPU and (self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD):
-                if self._is_finite(sensor.Value):
-                    loads.append(float(sensor.Value))
-        if loads:
-            return sum(loads) / len(loads)
+    @staticmethod
+    def _enum_int(member: Any) -> Optional[int]:
+        if member is None:
+            return None
+        try:
+            return int(member)
+        except Exception:
+            return None
+
+    def _hardware_type_set(self, *names: str) -> FrozenSet[int]:
+        members = (self._enum_int(getattr(self.HardwareType, n, None)) for n in names)
+        return frozenset(m for m in members if m is not None)
+
+    def _sensor_type_int(self, name: str) -> Optional[int]:
+        member = getattr(self.SensorType, name, None)
+        if member is not None:
+            return self._enum_int(member)
+        # Not surfaced as an attribute; resolve the member by name through System.Enum once
+        try:
+            import clr  # type: ignore
+            import System  # type: ignore
+            enum_type = clr.GetClrType(self.SensorType)
+            for candidate in System.Enum.GetNames(enum_type):
+                if str(candidate).lower() == name.lower():
+                    return self._enum_int(System.Enum.Parse(enum_type, candidate))
+        except Exception:
+            pass
         return None
 
-    def _select_cpu_core_clocks(self, sensors: List[Tuple[Any, Any, Any]]) -> Tuple[Optional[float], Optional[float]]:
-        clocks: List[float] = []
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) == self.HT_CPU and (self.ST_CLOCK is None or sensor.SensorType == self.ST_CLOCK):
+    def _collect_sensors(self) -> List[SensorRecord]:
+        # Returns list of (parent_hardware_type, sensor_type, lowercased_name, name_tags, sensor)
+        sensors: List[SensorRecord] = []
+        for hardware in self._hardware:
+            ht = self._enum_int(getattr(hardware, "HardwareType", None))
+            own = list(getattr(hardware, "Sensors", []) or [])
+            for sub in getattr(hardware, "SubHardware", []) or []:
+                own.extend(getattr(sub, "Sensors", []) or [])
+            for sensor in own:
                 name = (sensor.Name or "").lower()
-                if name.startswith("cpu core") or name.startswith("core") or "clock" in name:
-                    if self._is_finite(sensor.Value):
-                        clocks.append(float(sensor.Value))  # MHz
-        if clocks:
-            max_clock = max(clocks)
-            avg_clock = sum(clocks) / len(clocks)
-            return max_clock, avg_clock
-        return None, None
-
-    def _select_ram_used_free_gb(self, sensors: List[Tuple[Any, Any, Any]]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
-        used_gb: Optional[float] = None
-        free_gb: Optional[float] = None
-        load_percent: Optional[float] = None
-        for _hw, sensor, parent in sensors:
-            is_ram_hw = getattr(parent, "HardwareType", None) in (
-                getattr(self.HardwareType, "RAM", None),
-                getattr(self.HardwareType, "Memory", None),
-            )
-            if not is_ram_hw:
-                continue
-            name = (sensor.Name or "").lower()
+                sensors.append((ht, self._enum_int(sensor.SensorType), name, _name_tags(name), sensor))
+        return sensors
+
+    @staticmethod
+    def _is_finite(value: Optional[float]) -> bool:
+        # pythonnet already converts Nullable<float> sensor values to float or None
+        return value is not None and isfinite(value)
+
+    def _build_dispatch(self) -> Dict[Tuple[int, int], Callable[[int, Any], None]]:
+        # Map (parent hardware type, sensor type) to a handler that sorts values into buckets
+        add = self._add_value
+
+        def cpu_temp(tags: int, value: Any) -> None:
+            if tags & TAG_CCD:
+                add("cpu_ccd_temp", value)
+            elif tags & TAG_CORE:
+                add("cpu_core_temp", value)
+            elif tags & TAG_CPU_LABEL:
+                add("cpu_package_temp", value)
+
+        def mainboard_temp(tags: int, value: Any) -> None:
+            # Some boards expose CPU temp under mainboard/superIO
+            if tags & TAG_CPU_LABEL:
+                add("mb_cpu_temp", value)
+
+        def cpu_load(tags: int, value: Any) -> None:
+            if tags & TAG_TOTAL_LOAD:  # 'CPU Total' / 'Total'
+                add("cpu_total_load", value)
+            add("cpu_load", value)
+
+        def cpu_clock(tags: int, value: Any) -> None:
+            if tags & TAG_CORE_CLOCK:
+                add("cpu_clock", value)  # MHz
+
+        def cpu_power(tags: int, value: Any) -> None:
+            if tags & TAG_CPU_POWER:
+                add("cpu_power", value)
+
+        def ram_data(tags: int, value: Any) -> None:
             # Ignore Virtual Memory sensors; we only want physical Memory
-            if "virtual" in name:
+            if tags & TAG_VIRTUAL:
+                return
+            if tags & TAG_USED:
+                add("ram_used", value)
+            if tags & TAG_FREE:
+                add("ram_free", value)
+
+        def ram_load(tags: int, value: Any) -> None:
+            if tags & TAG_RAM_LOAD and not tags & TAG_VIRTUAL:
+                add("ram_load", value)
+
+        def gpu_temp(tags: int, value: Any) -> None:
+            if tags & TAG_HOTSPOT:
+                add("gpu_hotspot_temp", value)
+            else:
+                add("gpu_temp", value)
+
+        def gpu_load(tags: int, value: Any) -> None:
+            if tags & TAG_GPU_LOAD:
+                add("gpu_load", value)
+
+        def gpu_power(_tags: int, value: Any) -> None:
+            add("gpu_power", value)
+
+        def gpu_clock(tags: int, value: Any) -> None:
+            if tags & TAG_MEMORY:
+                add("gpu_mem_clock", value)
+            elif tags & TAG_CORE:
+                add("gpu_core_clock", value)
+
+        def net_load(_tags: int, value: Any) -> None:
+            # Clip to sane range
+            if self._is_finite(value) and 0.0 <= float(value) <= 100.0:
+                add("net_load", value)
+
+        routes: List[Tuple[Iterable[Optional[int]], Optional[int], Callable[[int, Any], None]]] = [
+            ((self.HT_CPU,), self.ST_TEMP, cpu_temp),
+            ((self.HT_MAINBOARD,), self.ST_TEMP, mainboard_temp),
+            ((self.HT_CPU,), self.ST_LOAD, cpu_load),
+            ((self.HT_CPU,), self.ST_CLOCK, cpu_clock),
+            ((self.HT_CPU,), self.ST_POWER, cpu_power),
+            (self._ram_ht_set, self.ST_DATA, ram_data),
+            (self._ram_ht_set, self.ST_LOAD, ram_load),
+            (self._gpu_ht_set, self.ST_TEMP, gpu_temp),
+            (self._gpu_ht_set, self.ST_LOAD, gpu_load),
+            (self._gpu_ht_set, self.ST_POWER, gpu_power),
+            (self._gpu_ht_set, self.ST_CLOCK, gpu_clock),
+            ((self.HT_NETWORK,), self.ST_LOAD, net_load),
+        ]
+        dispatch: Dict[Tuple[int, int], Callable[[int, Any], None]] = {}
+        for hardware_types, sensor_type, handler in routes:
+            if sensor_type is None:
                 continue
-            # Prefer direct Data sensors for used/available in GB
-            if (self.ST_DATA is not None and sensor.SensorType == self.ST_DATA) or (self.ST_DATA is None and sensor.SensorType.__str__().endswith("Data")):
-                if "used" in name and self._is_finite(sensor.Value):
-                    used_gb = float(sensor.Value)
-                if ("available" in name or "free" in name) and self._is_finite(sensor.Value):
-                    free_gb = float(sensor.Value)
-            # Capture load percentage as a fallback
-            if (self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD) and (
-                (name == "memory" or name == "ram") or ("memory" in name or "ram" in name) or ("load" in name or "usage" in name)
-            ):
-                if self._is_finite(sensor.Value):
-                    load_percent = float(sensor.Value)
-        return used_gb, free_gb, load_percent
-
-    def _select_ram_usage(self, sensors: List[Tuple[Any, Any, Any]]) -> Optional[float]:
-        # Prefer Load percentage if available
-        for _hw, sensor, parent in sensors:
-            is_ram_hw = getattr(parent, "HardwareType", None) in (
-                getattr(self.HardwareType, "RAM", None),
-                getattr(self.HardwareType, "Memory", None),
-            )
-            if is_ram_hw and (self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD):
-                if self._is_finite(sensor.Value):
-                    return float(sensor.Value)
-        # Fallback: derive from Used and Available
-        used: Optional[float] = None
-        available: Optional[float] = None
-        for _hw, sensor, parent in sensors:
-            is_ram_hw = getattr(parent, "HardwareType", None) in (
-                getattr(self.HardwareType, "RAM", None),
-                getattr(self.HardwareType, "Memory", None),
+            for ht in hardware_types:
+                if ht is not None:
+                    dispatch[(ht, sensor_type)] = handler
+        return dispatch
+
+    def _add_value(self, bucket: str, value: Any) -> None:
+        if self._is_finite(value):
+            self._buckets[bucket].append(float(value))
+
+    def _compile_gather(self, lhm_hardware: Any) -> Any:
+        # Compile a tiny C# helper that copies every sensor value into one float[], so a frame
+        # costs a single interop call plus a memcpy instead of one crossing per sensor.
+        # Needs the .NET Framework CodeDom compiler; callers fall back to per-sensor reads.
+        # Compiled once per process: each compile runs csc.exe and loads an assembly that
+        # .NET Framework never unloads, so route rebuilds only rebind the buffers.
+        try:
+            import clr  # type: ignore
+            import System  # type: ignore
+            clr.AddReference("System")
+            from Microsoft.CSharp import CSharpCodeProvider  # type: ignore
+            from System.CodeDom.Compiler import CompilerParameters  # type: ignore
+
+            params = CompilerParameters()
+            params.GenerateInMemory = True
+            params.ReferencedAssemblies.Add("System.dll")
+            params.ReferencedAssemblies.Add(clr.GetClrType(lhm_hardware.Computer).Assembly.Location)
+            results = CSharpCodeProvider().CompileAssemblyFromSource(
+                params, System.Array[System.String]([_GATHER_SOURCE])
             )
-            if not is_ram_hw:
-                continue
-            if (self.ST_DATA is not None and sensor.SensorType == self.ST_DATA) or (self.ST_DATA is None and sensor.SensorType.__str__().endswith("Data")):
-                name = (sensor.Name or "").lower()
-                if "used" in name:
-                    if self._is_finite(sensor.Value):
-                        used = float(sensor.Value)
-                if "available" in name:
-                    if self._is_finite(sensor.Value):
-                        available = float(sensor.Value)
-        if used is not None and available is not None and used + available > 0:
-            return used / (used + available) * 100.0
-        return None
+            if results.Errors.HasErrors:
+                return None
+            return results.CompiledAssembly.GetType("LHMBridge").GetMethod("Gather")
+        except Exception:
+            return None
 
-    def _select_gpu_metrics(self, sensors: List[Tuple[Any, Any, Any]]) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float], Optional[float], Optional[float]]:
-        temps: List[float] = []
-        hotspot_temps: List[float] = []
-        loads: List[float] = []
-        powers: List[float] = []
-        core_clocks: List[float] = []
-        mem_clocks: List[float] = []
-        gpu_types = [
-            getattr(self.HardwareType, "GpuNvidia", None),
-            getattr(self.HardwareType, "GpuAti", None),
-            getattr(self.HardwareType, "GpuAmd", None),
-            getattr(self.HardwareType, "GpuAmdRadeon", None),
-            getattr(self.HardwareType, "GpuIntel", None),
-        ]
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) in gpu_types:
-                if self.ST_TEMP is None or sensor.SensorType == self.ST_TEMP:
-                    name = (sensor.Name or "").lower()
-                    if any(k in name for k in ("hot spot", "hotspot", "junction")):
-                        if self._is_finite(sensor.Value):
-                            hotspot_temps.append(float(sensor.Value))
-                    else:
-                        if self._is_finite(sensor.Value):
-                            temps.append(float(sensor.Value))
-                if self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD:
-                    name = (sensor.Name or "").lower()
-                    if "core" in name or name in ("gpu core", "gpu"):
-                        if self._is_finite(sensor.Value):
-                            loads.append(float(sensor.Value))
-                if (self.ST_POWER is not None and sensor.SensorType == self.ST_POWER) or (self.ST_POWER is None and sensor.SensorType.__str__().endswith("Power")):
-                    # Some LHM builds expose SensorType.Power; string compare for safety
-                    if self._is_finite(sensor.Value):
-                        powers.append(float(sensor.Value))
-                if self.ST_CLOCK is None or sensor.SensorType == self.ST_CLOCK:
-                    name = (sensor.Name or "").lower()
-                    if "memory" in name and self._is_finite(sensor.Value):
-                        mem_clocks.append(float(sensor.Value))
-                    elif ("gpu core" in name or "core" in name) and self._is_finite(sensor.Value):
-                        core_clocks.append(float(sensor.Value))
-        core_temp = max(temps) if temps else None
-        hotspot = max(hotspot_temps) if hotspot_temps else None
-        load = max(loads) if loads else None
-        power = max(powers) if powers else None
-        core_clock = max(core_clocks) if core_clocks else None
-        mem_clock = max(mem_clocks) if mem_clocks else None
-        return core_temp, hotspot, load, power, core_clock, mem_clock
-
-
-    def read_metrics(self) -> Dict[str, Optional[float]]:
-        self._update_all()
-        sensors = self._collect_sensors()
-
-        cpu_core_temp, cpu_hotspot_temp = self._select_cpu_temps(sensors)
-        cpu_load = self._select_cpu_total_load(sensors)
-        cpu_clock_max_mhz, cpu_clock_avg_mhz = self._select_cpu_core_clocks(sensors)
-        ram_used_gb, ram_free_gb, ram_usage = self._select_ram_used_free_gb(sensors)
-        gpu_core_temp, gpu_hotspot_temp, gpu_load, gpu_power, gpu_core_clock, gpu_mem_clock = self._select_gpu_metrics(sensors)
-        # Network load (percent) across adapters; prefer a 'Total'/'Utilization' load, else max
-        net_load_values: List[float] = []
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) == self.HT_NETWORK and (self.ST_LOAD is None or sensor.SensorType == self.ST_LOAD):
-                name = (sensor.Name or "").strip().lower()
-                if self._is_finite(sensor.Value):
-                    # Heuristic: allow all load sensors, we'll pick preferred labels later
-                    val = float(sensor.Value)
-                    # Clip to sane range
-                    if 0.0 <= val <= 100.0:
-                        net_load_values.append(val)
-        net_load: Optional[float] = None
-        if net_load_values:
+    def _build_gather(self, sensors: List[Any]) -> Optional[Callable[[], Sequence[float]]]:
+        # Bind the compiled helper to the current routed sensors
+        method = self._gather_method
+        if method is None or not sensors:
+            return None
+        try:
+            import System  # type: ignore
+            from System.Runtime.InteropServices import Marshal  # type: ignore
+
+            count = len(sensors)
+            net_values = System.Array.CreateInstance(System.Single, count)
+            args = System.Array[System.Object]([System.Array[self._lhm_hardware.ISensor](sensors), net_values])
+            # Fixed-size buffer; its address stays valid because it is never resized
+            values = array("f", bytes(4 * count))
+            dest = System.IntPtr(values.buffer_info()[0])
+        except Exception:
+            return None
+
+        def gather() -> Sequence[float]:
+            method.Invoke(None, args)
+            Marshal.Copy(net_values, 0, dest, count)
+            return values
+
+        return gather
+
+    def _classify(self) -> Dict[str, Optional[float]]:
+        # Single pass over the routed sensors; handlers fill the pre-allocated buckets
+        buckets = self._buckets
+        for values in buckets.values():
+            del values[:]
+        gather = self._gather
+        if gather is not None:
+            sensor_values: Sequence[Any] = gather()
+        else:
+            sensor_values = [sensor.Value for sensor in self._routed_sensors]
+        for (handler, tags), value in zip(self._routed_handlers, sensor_values):
+            handler(tags, value)
+
+        def avg(values: "array[float]") -> Optional[float]:
+            return fmean(values) if values else None
+
+        def peak(values: "array[float]") -> Optional[float]:
+            return max(values) if values else None
+
+        def last(values: "array[float]") -> Optional[float]:
+            return values[-1] if values else None
+
+        ccd = buckets["cpu_ccd_temp"]
+        cores = buckets["cpu_core_temp"]
+        package = buckets["cpu_package_temp"]
+        mainboard = buckets["mb_cpu_temp"]
+        # Hotspot: max core sensor, fallback to package, then mainboard
+        hotspot_source = cores or package or mainboard
+        # Core temp: average of CCDs if present, else average of cores, else package/mainboard
+        core_source = ccd or cores or package or mainboard
+
+        total_load = buckets["cpu_total_load"]
+        clocks = buckets["cpu_clock"]
+        return {
+            "cpu_core_temp": avg(core_source),
+            "cpu_hotspot_temp": peak(hotspot_source),
+            # Prefer an explicit 'total' sensor, else average all CPU load sensors
+            "cpu_load": total_load[0] if total_load else avg(buckets["cpu_load"]),
+            "cpu_clock_max": peak(clocks),
+            "cpu_clock_avg": avg(clocks),
+            "cpu_power": peak(buckets["cpu_power"]),
+            "ram_used": last(buckets["ram_used"]),
+            "ram_free": last(buckets["ram_free"]),
+            "ram_usage": last(buckets["ram_load"]),
+            "gpu_core_temp": peak(buckets["gpu_temp"]),
+            "gpu_hotspot_temp": peak(buckets["gpu_hotspot_temp"]),
+            "gpu_load": peak(buckets["gpu_load"]),
+            "gpu_power": peak(buckets["gpu_power"]),
+            "gpu_core_clock": peak(buckets["gpu_core_clock"]),
+            "gpu_mem_clock": peak(buckets["gpu_mem_clock"]),
             # Prefer a representative high value as overall utilization
-            net_load = max(net_load_values)
-
-        # CPU package power (where available)
-        cpu_powers: List[float] = []
-        for _hw, sensor, parent in sensors:
-            if getattr(parent, "HardwareType", None) == self.HT_CPU and (
-                (self.ST_POWER is not None and sensor.SensorType == self.ST_POWER) or
-                (self.ST_POWER is None and sensor.SensorType.__str__().endswith("Power"))
-            ):
-                name = (sensor.Name or "").lower()
-                if any(k in name for k in ("package", "cpu", "ppt", "socket", "total")):
-                    if self._is_finite(sensor.Value):
-                        cpu_powers.append(float(sensor.Value))
-        cpu_power = max(cpu_powers) if cpu_powers else None
+            "net_load": peak(buckets["net_load"]),
+        }
 
+    def read_metrics(self, update_timeout: Optional[float] = None) -> Dict[str, Any]:
+        # Callers pace the reads; update_timeout bounds how long one slow device may hold a frame
+        self._refresh_hardware(time.monotonic(), update_timeout)
+        self._update_all(timeout=update_timeout)
+        m = self._classify()
         return {
             "cpu": {
-                "core_temperature_c": _round_or_none(cpu_core_temp, 1),
-                "hotspot_temperature_c": _round_or_none(cpu_hotspot_temp, 1),
-                "usage_percent": _round_or_none(cpu_load, 1),
-                "max_clock_mhz": _round_or_none(cpu_clock_max_mhz, 0),
-                "avg_clock_mhz": _round_or_none(cpu_clock_avg_mhz, 0),
-                "power_w": _round_or_none(cpu_power, 1),
+                "core_temperature_c": _round_or_none(m["cpu_core_temp"], 1),
+                "hotspot_temperature_c": _round_or_none(m["cpu_hotspot_temp"], 1),
+                "usage_percent": _round_or_none(m["cpu_load"], 1),
+                "max_clock_mhz": _round_or_none(m["cpu_clock_max"], 0),
+                "avg_clock_mhz": _round_or_none(m["cpu_clock_avg"], 0),
+                "power_w": _round_or_none(m["cpu_power"], 1),
             },
             "ram": {
-                "usage_percent": _round_or_none(ram_usage, 1),
-                "used_gb": _round_or_none(ram_used_gb, 1),
-                "free_gb": _round_or_none(ram_free_gb, 1),
+                "usage_percent": _round_or_none(m["ram_usage"], 1),
+                "used_gb": _round_or_none(m["ram_used"], 1),
+                "free_gb": _round_or_none(m["ram_free"], 1),
             },
             "gpu": {
-                "core_temperature_c": _round_or_none(gpu_core_temp, 1),
-                "hotspot_temperature_c": _round_or_none(gpu_hotspot_temp, 1),
-                "usage_percent": _round_or_none(gpu_load, 1),
-                "core_clock_mhz": _round_or_none(gpu_core_clock, 0),
-                "memory_clock_mhz": _round_or_none(gpu_mem_clock, 0),
-                "power_w": _round_or_none(gpu_power, 1),
+                "core_temperature_c": _round_or_none(m["gpu_core_temp"], 1),
+                "hotspot_temperature_c": _round_or_none(m["gpu_hotspot_temp"], 1),
+                "usage_percent": _round_or_none(m["gpu_load"], 1),
+                "core_clock_mhz": _round_or_none(m["gpu_core_clock"], 0),
+                "memory_clock_mhz": _round_or_none(m["gpu_mem_clock"], 0),
+                "power_w": _round_or_none(m["gpu_power"], 1),
             },
             "net": {
-                "usage_percent": _round_or_none(net_load, 1),
+                "usage_percent": _round_or_none(m["net_load"], 1),
             },
             "timestamp": time.time(),
         }
@@ -464,8 +741,8 @@ class CompositeMetricsReader:
     def __init__(self, dll_path: Optional[str]) -> None:
         self.hw = HardwareMonitorReader(dll_path=dll_path)
 
-    def read_metrics(self) -> Dict[str, Optional[float]]:
-        return self.hw.read_metrics()
+    def read_metrics(self, update_timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self.hw.read_metrics(update_timeout)
 
 
  
@@ -504,6 +781,27 @@ SENSOR_KEYS_DEFAULT: List[str] = [
     "gpu_power",
 ]
 
+# Where each tile's value lives in a read_metrics() snapshot (order is not significant;
+# the /api/metrics.bin layout is fixed separately by METRICS_BIN_KEYS)
+METRIC_PATHS: Dict[str, Tuple[str, str]] = {
+    "cpu_core_temp": ("cpu", "core_temperature_c"),
+    "cpu_hotspot_temp": ("cpu", "hotspot_temperature_c"),
+    "cpu_usage": ("cpu", "usage_percent"),
+    "net_load": ("net", "usage_percent"),
+    "cpu_clock_max": ("cpu", "max_clock_mhz"),
+    "cpu_clock_avg": ("cpu", "avg_clock_mhz"),
+    "cpu_power": ("cpu", "power_w"),
+    "ram_usage": ("ram", "usage_percent"),
+    "ram_used": ("ram", "used_gb"),
+    "ram_free": ("ram", "free_gb"),
+    "gpu_core_temp": ("gpu", "core_temperature_c"),
+    "gpu_hotspot_temp": ("gpu", "hotspot_temperature_c"),
+    "gpu_clock": ("gpu", "core_clock_mhz"),
+    "gpu_mem_clock": ("gpu", "memory_clock_mhz"),
+    "gpu_usage": ("gpu", "usage_percent"),
+    "gpu_power": ("gpu", "power_w"),
+}
+
 UI_CONFIG: Dict[str, Any] = {
     "order": SENSOR_KEYS_DEFAULT.copy(),
     "update_interval_sec": 1.0,
@@ -517,30 +815,37 @@ ALIAS_TO_CANON: Dict[str, str] = {
 CANON_TO_EXTERNAL: Dict[str, str] = {}
 
 
+_SENSOR_KEYS_SET: FrozenSet[str] = frozenset(SENSOR_KEYS_DEFAULT)
+
+
 def _normalize_order(order: List[str]) -> List[str]:
-    seen: set = set()
-    normalized: List[str] = []
-    for key in order:
-        canon = ALIAS_TO_CANON.get(key, key)
-        if canon in SENSOR_KEYS_DEFAULT and canon not in seen:
-            normalized.append(canon)
-            seen.add(canon)
+    # dict.fromkeys keeps first occurrence order while dropping duplicates
+    seen = dict.fromkeys(
+        canon for canon in (ALIAS_TO_CANON.get(key, key) for key in order) if canon in _SENSOR_KEYS_SET
+    )
     # Append any missing keys at the end, in default order
-    for key in SENSOR_KEYS_DEFAULT:
-        if key not in seen:
-            normalized.append(key)
-    return normalized
+    return list(seen) + [key for key in SENSOR_KEYS_DEFAULT if key not in seen]
+
+
+# In-memory copy of config.ini, loaded once; saves mutate it and rewrite the file atomically
+_cfg = configparser.ConfigParser()
+_cfg_lock = threading.Lock()
+# mtime of config.ini as last read or written by this process; drives Last-Modified on /api/config
+_config_mtime: Optional[float] = None
 
 
 def load_ui_config() -> Dict[str, Any]:
+    global _cfg, _config_mtime
     cfg = configparser.ConfigParser()
     result = {
         "order": SENSOR_KEYS_DEFAULT.copy(),
         "update_interval_sec": 1.0,
+        "lhm_dll_path": None,
     }
     try:
         if os.path.exists(CONFIG_PATH):
             cfg.read(CONFIG_PATH)
+            _config_mtime = os.path.getmtime(CONFIG_PATH)
             if cfg.has_section("ui"):
                 order_str = cfg.get("ui", "order", fallback=",")
                 order_list = [s.strip() for s in order_str.split(",") if s.strip()]
@@ -549,33 +854,47 @@ def load_ui_config() -> Dict[str, Any]:
                     result["update_interval_sec"] = max(0.05, float(cfg.get("ui", "update_interval_sec", fallback="1.0")))
                 except Exception:
                     result["update_interval_sec"] = 1.0
+            if cfg.has_section("lhm"):
+                result["lhm_dll_path"] = cfg.get("lhm", "dll_path", fallback="") or None
     except Exception:
         # Ignore config read errors and use defaults
         pass
+    with _cfg_lock:
+        _cfg = cfg
     return result
 
 
-def save_ui_config(order: Optional[List[str]] = None, update_interval_sec: Optional[float] = None) -> None:
-    cfg = configparser.ConfigParser()
-    try:
-        if os.path.exists(CONFIG_PATH):
-            cfg.read(CONFIG_PATH)
-    except Exception:
-        cfg = configparser.ConfigParser()
-    if not cfg.has_section("ui"):
-        cfg.add_section("ui")
-    if order is not None:
-        canon_list = _normalize_order(order)
-        external_list = [CANON_TO_EXTERNAL.get(k, k) for k in canon_list]
-        cfg.set("ui", "order", ",".join(external_list))
-    if update_interval_sec is not None:
-        try:
-            val = max(0.05, float(update_interval_sec))
-        except Exception:
-            val = 1.0
-        cfg.set("ui", "update_interval_sec", f"{val:.3f}")
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        cfg.write(f)
+def save_ui_config(
+    order: Optional[List[str]] = None,
+    update_interval_sec: Optional[float] = None,
+    lhm_dll_path: Optional[str] = None,
+) -> None:
+    global _config_mtime
+    with _cfg_lock:
+        cfg = _cfg
+        if not cfg.has_section("ui"):
+            cfg.add_section("ui")
+        if order is not None:
+            canon_list = _normalize_order(order)
+            external_list = [CANON_TO_EXTERNAL.get(k, k) for k in canon_list]
+            cfg.set("ui", "order", ",".join(external_list))
+        if update_interval_sec is not None:
+            try:
+                val = max(0.05, float(update_interval_sec))
+            except Exception:
+                val = 1.0
+            cfg.set("ui", "update_interval_sec", f"{val:.3f}")
+        if lhm_dll_path is not None:
+            # Resolved LibreHardwareMonitorLib.dll location, reused on the next start
+            if not cfg.has_section("lhm"):
+                cfg.add_section("lhm")
+            cfg.set("lhm", "dll_path", lhm_dll_path)
+        # Write to a sibling temp file and swap it in so readers never see a torn file
+        tmp_path = CONFIG_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            cfg.write(f)
+        os.replace(tmp_path, CONFIG_PATH)
+        _config_mtime = os.path.getmtime(CONFIG_PATH)
 
 # --- Minimal Django setup ---
 def configure_django() -> None:
@@ -586,6 +905,8 @@ def configure_django() -> None:
         DEBUG=False,
         SECRET_KEY="monitor-server-secret-key",
         ROOT_URLCONF=__name__,
+        # runserver and the wsgiref servers both go through the metrics fast path below
+        WSGI_APPLICATION=f"{__name__}.wsgi_application",
         ALLOWED_HOSTS=["*"],
         MIDDLEWARE=[],
         INSTALLED_APPS=[
@@ -600,32 +921,268 @@ def configure_django() -> None:
 
 
 # Views
-from django.http import HttpRequest, HttpResponse, JsonResponse  # type: ignore
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified, StreamingHttpResponse  # type: ignore
 from django.urls import path  # type: ignore
+from django.utils.http import http_date, parse_http_date_safe  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional; stdlib json is used when missing
+    orjson = None
+
+
+def _json_bytes(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class FastJsonResponse(HttpResponse):
+    """JSON response encoded with orjson when available (compact stdlib json otherwise)."""
+
+    def __init__(self, data: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(_json_bytes(data), **kwargs)
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+# The reader is created on first use so the HTTP server binds without waiting for pythonnet/LHM
 ohm_reader: Optional[CompositeMetricsReader] = None
+_reader_lock = threading.Lock()
+_reader_dll_path: Optional[str] = None
+_reader_error: Optional[str] = None
+
+
+def get_reader() -> Optional[CompositeMetricsReader]:
+    global ohm_reader, _reader_error
+    if ohm_reader is None and _reader_error is None:
+        with _reader_lock:
+            if ohm_reader is None and _reader_error is None:
+                try:
+                    ohm_reader = CompositeMetricsReader(dll_path=_reader_dll_path)
+                except Exception as exc:
+                    _reader_error = str(exc)
+                    print(f"Failed to initialize LibreHardwareMonitor: {exc}")
+    return ohm_reader
+
+# Latest snapshot produced by the refresh thread (pre-encoded JSON); shared by every HTTP client
+_metrics_lock = threading.Lock()
+_metrics_changed = threading.Condition(_metrics_lock)
+_metrics_seq = 0
+_latest_bytes: Optional[bytes] = None
+# Flat {tile_key: value} view of the latest snapshot and its delta against the previous one
+_latest_flat: Dict[str, Any] = {}
+_latest_delta_bytes: Optional[bytes] = None
+# Same values packed for /api/metrics.bin, one float64 per key of METRICS_BIN_KEYS
+_latest_bin: Optional[bytes] = None
+# Set once reads have failed METRICS_STALE_AFTER_FAILURES times in a row; cleared by the next good read
+_metrics_error: Optional[str] = None
+# Field order of the binary wire format. APPEND-ONLY: never reorder, rename or remove entries.
+# The page caches for an hour, and an older copy decodes the fields it knows by position, so
+# new keys go at the end. INDEX_HTML gets this list interpolated when the module loads.
+METRICS_BIN_KEYS: Tuple[str, ...] = (
+    "cpu_core_temp",
+    "cpu_hotspot_temp",
+    "cpu_usage",
+    "net_load",
+    "cpu_clock_max",
+    "cpu_clock_avg",
+    "cpu_power",
+    "ram_usage",
+    "ram_used",
+    "ram_free",
+    "gpu_core_temp",
+    "gpu_hotspot_temp",
+    "gpu_clock",
+    "gpu_mem_clock",
+    "gpu_usage",
+    "gpu_power",
+)
+assert set(METRICS_BIN_KEYS) == set(METRIC_PATHS), "METRICS_BIN_KEYS must list every METRIC_PATHS key"
+_METRICS_BIN = struct.Struct(f"<{len(METRICS_BIN_KEYS)}d")
+
+# Comment frame sent to idle event streams so proxies and browsers keep the connection open
+SSE_KEEPALIVE_SEC = 15.0
+# Consecutive read failures after which the last snapshot is dropped and endpoints report an error
+METRICS_STALE_AFTER_FAILURES = 5
+
+
+def _flatten_metrics(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: (snapshot.get(group) or {}).get(field) for key, (group, field) in METRIC_PATHS.items()}
 
 
-def metrics_json(_request: HttpRequest) -> JsonResponse:
-    if ohm_reader is None:
-        return JsonResponse({"error": "LibreHardwareMonitor not initialized"}, status=500)
-    data = ohm_reader.read_metrics()
-    return JsonResponse(data)
+def _pack_metrics(flat: Dict[str, Any]) -> bytes:
+    nan = float("nan")
+    return _METRICS_BIN.pack(*(nan if flat.get(k) is None else flat[k] for k in METRICS_BIN_KEYS))
 
 
-def config_view(request: HttpRequest) -> JsonResponse:
+def _metrics_delta(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in current.items() if k not in previous or previous[k] != v}
+
+
+def _metrics_refresh_loop() -> None:
+    # One LHM refresh per configured interval, independent of how many clients poll
+    global _latest_bytes, _latest_bin, _latest_flat, _latest_delta_bytes, _metrics_seq, _metrics_error
+    failures = 0
+    while True:
+        started = time.monotonic()
+        interval = max(0.05, float(UI_CONFIG.get("update_interval_sec", 1.0)))
+        reader = get_reader()
+        if reader is None:
+            # Wake event streams so they end instead of waiting for data that will never come
+            with _metrics_changed:
+                _metrics_changed.notify_all()
+        else:
+            try:
+                # A device still stuck after most of the interval keeps its previous values
+                snapshot = reader.read_metrics(update_timeout=interval * 0.8)
+                encoded = _json_bytes(snapshot)
+                flat = _flatten_metrics(snapshot)
+                packed = _pack_metrics(flat)
+            except Exception as exc:
+                # Keep serving the previous snapshot on transient read errors, but not indefinitely
+                failures += 1
+                if failures == 1:
+                    print(f"Failed to read metrics: {exc}")
+                if failures == METRICS_STALE_AFTER_FAILURES:
+                    print(f"Metrics reads failed {failures} times in a row; reporting errors until they recover")
+                    with _metrics_changed:
+                        _latest_bytes = None
+                        _latest_bin = None
+                        _metrics_error = str(exc)
+                        _metrics_changed.notify_all()
+            else:
+                if failures:
+                    print(f"Metrics reads recovered after {failures} failure(s)")
+                    failures = 0
+                with _metrics_changed:
+                    _metrics_error = None
+                    delta = _metrics_delta(_latest_flat, flat)
+                    _latest_bytes = encoded
+                    _latest_bin = packed
+                    _latest_flat = flat
+                    # Event streams are only woken when a value actually changed
+                    if delta:
+                        _latest_delta_bytes = _json_bytes(delta)
+                        _metrics_seq += 1
+                        _metrics_changed.notify_all()
+        time.sleep(max(0.05, interval - (time.monotonic() - started)))
+
+
+def start_metrics_refresher() -> None:
+    threading.Thread(target=_metrics_refresh_loop, name="metrics-refresh", daemon=True).start()
+
+
+def _latest_metrics_response(binary: bool) -> HttpResponse:
+    if _reader_error is not None:
+        return FastJsonResponse({"error": "LibreHardwareMonitor not initialized"}, status=500)
+    with _metrics_lock:
+        body = _latest_bin if binary else _latest_bytes
+        error = _metrics_error
+    if error is not None:
+        # The last snapshot is too old to pass off as current
+        return FastJsonResponse({"error": f"Failed to read metrics: {error}"}, status=500)
+    if body is None:
+        # Hardware is still being initialized by the refresh thread
+        return FastJsonResponse({"error": "Metrics not available yet"}, status=503)
+    return HttpResponse(body, content_type="application/octet-stream" if binary else "application/json")
+
+
+def metrics_json(_request: HttpRequest) -> HttpResponse:
+    return _latest_metrics_response(binary=False)
+
+
+def metrics_bin(_request: HttpRequest) -> HttpResponse:
+    return _latest_metrics_response(binary=True)
+
+
+def _metrics_event_stream() -> Iterator[bytes]:
+    # Frames are flat {tile_key: value} objects holding only what changed since the last frame
+    # this client received; the first frame carries every key.
+    last_seq = -1
+    sent: Dict[str, Any] = {}
+
+    def ready() -> bool:
+        # Nothing to send until the refresh thread has published a first snapshot
+        return (
+            (_metrics_seq != last_seq and bool(_latest_flat))
+            or _reader_error is not None
+            or _metrics_error is not None
+        )
+
+    while True:
+        with _metrics_changed:
+            _metrics_changed.wait_for(ready, timeout=SSE_KEEPALIVE_SEC)
+            seq, flat, shared_delta = _metrics_seq, _latest_flat, _latest_delta_bytes
+        if _reader_error is not None or _metrics_error is not None:
+            # Reader init or reads failed after the client connected; the reconnect gets the 500
+            # from metrics_stream and the page falls back to polling until reads recover
+            return
+        if not flat or seq == last_seq:
+            yield b": keepalive\n\n"
+            continue
+        if sent and seq == last_seq + 1 and shared_delta is not None:
+            # Common case: client saw the previous frame, reuse the delta encoded by the refresh thread
+            body = shared_delta
+        else:
+            delta = _metrics_delta(sent, flat)
+            body = _json_bytes(delta) if delta else b""
+        last_seq = seq
+        sent = flat
+        if body:
+            yield b"data: " + body + b"\n\n"
+
+
+def metrics_stream(_request: HttpRequest) -> HttpResponse:
+    if _reader_error is not None:
+        return FastJsonResponse({"error": "LibreHardwareMonitor not initialized"}, status=500)
+    if _metrics_error is not None:
+        return FastJsonResponse({"error": f"Failed to read metrics: {_metrics_error}"}, status=500)
+    response = StreamingHttpResponse(_metrics_event_stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _config_get(request: HttpRequest) -> HttpResponse:
+    body = _json_bytes({
+        "order": UI_CONFIG.get("order", SENSOR_KEYS_DEFAULT),
+        "update_interval_sec": UI_CONFIG.get("update_interval_sec", 1.0),
+    })
+    # Hash the body for the ETag: saves within the same second share a Last-Modified value
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    mtime = _config_mtime
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+        not_modified = since is not None and mtime is not None and int(mtime) <= since
+    if not_modified:
+        response: HttpResponse = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    # Always revalidate: the config changes on POST, so no heuristic freshness
+    response["Cache-Control"] = "no-cache"
+    if mtime is not None:
+        response["Last-Modified"] = http_date(mtime)
+    return response
+
+
+def config_view(request: HttpRequest) -> HttpResponse:
     global UI_CONFIG
     if request.method == "GET":
-        return JsonResponse({
-            "order": UI_CONFIG.get("order", SENSOR_KEYS_DEFAULT),
-            "update_interval_sec": UI_CONFIG.get("update_interval_sec", 1.0),
-        })
+        return _config_get(request)
     try:
         body = request.body.decode("utf-8") if request.body else "{}"
         payload = json.loads(body or "{}")
     except Exception:
-        return JsonResponse({"error": "Invalid JSON"}, status=400)
+        return FastJsonResponse({"error": "Invalid JSON"}, status=400)
     order = payload.get("order")
     update_interval_sec = payload.get("update_interval_sec")
     if order is not None and isinstance(order, list):
@@ -638,12 +1195,11 @@ def config_view(request: HttpRequest) -> JsonResponse:
     try:
         save_ui_config(order=UI_CONFIG.get("order"), update_interval_sec=UI_CONFIG.get("update_interval_sec"))
     except Exception:
-        return JsonResponse({"error": "Failed to save config"}, status=500)
-    return JsonResponse({"ok": True})
+        return FastJsonResponse({"error": "Failed to save config"}, status=500)
+    return FastJsonResponse({"ok": True})
 
 
-def index(_request: HttpRequest) -> HttpResponse:
-    html = """
+INDEX_HTML = """
 <!doctype html>
 <html lang="en">
 <head>
@@ -663,6 +1219,7 @@ def index(_request: HttpRequest) -> HttpResponse:
     .grid { display:grid; grid-template-columns: repeat(3, minmax(0, 1fr)); grid-auto-rows: 1fr; gap: 10px 18px; }
     .item { display:flex; flex-direction:column; justify-content:center; align-items:flex-start; background:transparent; padding: 6px 0; border-radius:8px; }
     .value { font-size: 2.2rem; line-height:1.1; font-weight: 700; color: var(--fg); }
+    @property --t { syntax: '<number>'; inherits: false; initial-value: 0; }
     .unit { opacity: 0.9; font-weight: 600; font-size: 1.1rem; margin-left: 6px; }
     .label-below { margin-top: 4px; font-size: 0.85rem; color: var(--accent); text-transform: uppercase; letter-spacing: .04em; }
     .fs-btn { position: fixed; right: 14px; top: 12px; z-index: 10; background: rgba(255,255,255,0.06); color:#fff; border: 1px solid rgba(255,255,255,0.15); border-radius: 10px; padding: 8px 12px; font-weight: 600; letter-spacing: .02em; }
@@ -673,7 +1230,7 @@ def index(_request: HttpRequest) -> HttpResponse:
     .reorder-btn:active { transform: scale(0.98); }
 
     /* Settings overlay */
-    .overlay { position: fixed; inset: 0; background: rgba(0,0,0,0.6); backdrop-filter: blur(2px); display: none; align-items: center; justify-content: center; z-index: 20; }
+    .overlay { position: fixed; inset: 0; background: rgba(0,0,0,0.78); display: none; align-items: center; justify-content: center; z-index: 20; }
     .overlay.open { display: flex; }
     .panel { background: #0f0f10; border: 1px solid rgba(255,255,255,0.15); border-radius: 12px; padding: 16px 18px; width: min(440px, 92vw); color: #fff; }
     .panel h2 { margin: 0 0 10px 0; font-size: 1.1rem; letter-spacing: .04em; }
@@ -753,15 +1310,9 @@ def index(_request: HttpRequest) -> HttpResponse:
         [1.000, [255, 220, 120]],
       ],
     };
+    // COLOR_MAP is fixed at load; resolve its stops once
+    const STOPS = Object.freeze(COLOR_STOPS[COLOR_MAP] || COLOR_STOPS.magma);
     function clamp01(x){ return Math.max(0, Math.min(1, x)); }
-    function lerp(a,b,t){ return a + (b - a) * t; }
-    function lerpColor(c1, c2, t){
-      return [
-        Math.round(lerp(c1[0], c2[0], t)),
-        Math.round(lerp(c1[1], c2[1], t)),
-        Math.round(lerp(c1[2], c2[2], t))
-      ];
-    }
     const LIGHTEN = 0.14; // mix with white for better readability on black
     function lightenColor(rgb, amt){
       const r = Math.round(rgb[0] + (255 - rgb[0]) * amt);
@@ -769,33 +1320,35 @@ def index(_request: HttpRequest) -> HttpResponse:
       const b = Math.round(rgb[2] + (255 - rgb[2]) * amt);
       return [r,g,b];
     }
-    function sampleColorMap(t){
-      const stops = COLOR_STOPS[COLOR_MAP] || COLOR_STOPS.magma;
-      t = clamp01(t);
-      for (let i = 0; i < stops.length - 1; i++){
-        const [p1, c1] = stops[i];
-        const [p2, c2] = stops[i+1];
-        if (t >= p1 && t <= p2){
-          const nt = (t - p1) / (p2 - p1);
-          const rgb = lerpColor(c1, c2, nt);
-          const [r,g,b] = lightenColor(rgb, LIGHTEN);
-          return `rgb(${r}, ${g}, ${b})`;
-        }
+    // Build the colormap as one CSS color expression of --t (0..1): a chain of nested
+    // color-mix() calls, one per segment, each clamped to its own [p1, p2] range.
+    // Lightening is affine, so lightening the stops equals lightening the lerp.
+    function colorMapCss(){
+      const rgb = c => { const [r,g,b] = lightenColor(c, LIGHTEN); return `rgb(${r} ${g} ${b})`; };
+      let expr = rgb(STOPS[0][1]);
+      for (let i = 0; i < STOPS.length - 1; i++){
+        const [p1] = STOPS[i];
+        const [p2, c2] = STOPS[i+1];
+        expr = `color-mix(in srgb, ${expr}, ${rgb(c2)} calc(clamp(0, (var(--t) - ${p1}) / ${+(p2 - p1).toFixed(6)}, 1) * 100%))`;
       }
-      const last = lightenColor(stops[stops.length - 1][1], LIGHTEN);
-      return `rgb(${last[0]}, ${last[1]}, ${last[2]})`;
+      return expr;
     }
-    function valueToColor(value, unit){
-      if (value === null || value === undefined) return 'var(--fg)';
-      let percent = 0;
-      if (unit === '%') {
-        percent = value;
-      } else if (unit.indexOf('°C') !== -1) {
-        percent = value; // assume 0-100°C range
-      } else {
-        return 'var(--fg)';
-      }
-      return sampleColorMap(clamp01(percent / 100));
+    // The browser evaluates the colormap during style resolution; JS only sets --t per tile
+    const COLOR_MAP_STYLE = document.createElement('style');
+    COLOR_MAP_STYLE.textContent = `.value .v.scaled { color: ${colorMapCss()}; }`;
+    document.head.appendChild(COLOR_MAP_STYLE);
+    // Colormap kind per tile, resolved once at tile-cache build time
+    const KIND_NONE = 0, KIND_PERCENT = 1, KIND_TEMP = 2;
+    const UNIT_KIND = {
+      cpu_core_temp: KIND_TEMP, cpu_hotspot_temp: KIND_TEMP, cpu_usage: KIND_PERCENT,
+      net_load: KIND_PERCENT, ram_usage: KIND_PERCENT,
+      gpu_core_temp: KIND_TEMP, gpu_hotspot_temp: KIND_TEMP, gpu_usage: KIND_PERCENT,
+    };
+    // Position of a value on the colormap (0..1), or null when the value is not colored
+    function valueToScale(value, kind){
+      if (value === null || value === undefined || kind === KIND_NONE) return null;
+      // Percentages map directly; temperatures assume a 0-100°C range
+      return clamp01(value / 100);
     }
     function updateViewportHeightVar() {
       const vh = Math.max(document.documentElement.clientHeight, window.innerHeight || 0);
@@ -868,35 +1421,108 @@ def index(_request: HttpRequest) -> HttpResponse:
     let pollTimer = null;
     let IS_REORDER = false;
 
+    let metricsSource = null;
+
+    // Tiles in their default order: [key, unit, label]; buildGrid renders one per row
+    const TILES_META = [
+      ['cpu_core_temp', '°C', 'CPU Core Temp'], ['cpu_hotspot_temp', '°C', 'CPU Hot Spot'],
+      ['cpu_usage', '%', 'CPU Usage'], ['cpu_clock_max', 'MHz', 'CPU Max Clock'],
+      ['net_load', '%', 'Network Load'], ['cpu_clock_avg', 'MHz', 'CPU Avg Clock'], ['cpu_power', 'W', 'CPU Power'],
+      ['ram_usage', '%', 'RAM Usage'], ['ram_used', 'GB', 'RAM Used'], ['ram_free', 'GB', 'RAM Free'],
+      ['gpu_core_temp', '°C', 'GPU Core Temp'], ['gpu_hotspot_temp', '°C', 'GPU Hot Spot'],
+      ['gpu_clock', 'MHz', 'GPU Clock'], ['gpu_mem_clock', 'MHz', 'GPU Mem Clock'],
+      ['gpu_usage', '%', 'GPU Usage'], ['gpu_power', 'W', 'GPU Power'],
+    ];
+    const UNIT_BY_KEY = Object.fromEntries(TILES_META.map(([key, unit]) => [key, unit]));
+    // Field order of /api/metrics.bin, filled in from the server's METRICS_BIN_KEYS: one little-endian float64 each
+    const METRICS_BIN_KEYS = __METRICS_BIN_KEYS__;
+    function decodeMetrics(buf) {
+      const view = new DataView(buf);
+      const flat = {};
+      for (let i = 0; i < METRICS_BIN_KEYS.length; i++) {
+        const v = view.getFloat64(i * 8, true);
+        flat[METRICS_BIN_KEYS[i]] = Number.isNaN(v) ? null : v;
+      }
+      return flat;
+    }
+    // Updates are merged per key and written in one animation frame, so a burst of
+    // messages (or a hidden tab, where rAF is paused) costs at most one batch of writes
+    let pendingMetrics = null;
+    function flushMetrics() {
+      const flat = pendingMetrics;
+      pendingMetrics = null;
+      for (const key in flat) setValue(key, flat[key], UNIT_BY_KEY[key]);
+    }
+    // Takes a flat {tile_key: value} object; stream frames only carry keys that changed
+    function applyMetrics(flat) {
+      if (pendingMetrics === null) {
+        pendingMetrics = {};
+        requestAnimationFrame(flushMetrics);
+      }
+      Object.assign(pendingMetrics, flat);
+    }
+
+    let pollAbort = null;
+    let pollGen = 0;
+    let IS_POLLING = false;
+
     async function fetchMetrics() {
+      // A newer request supersedes one still in flight
+      if (pollAbort) pollAbort.abort();
+      const ctrl = (typeof AbortController !== 'undefined') ? new AbortController() : null;
+      pollAbort = ctrl;
       try {
-        const res = await fetch('/api/metrics', { cache: 'no-store' });
-        if (!res.ok) throw new Error('HTTP ' + res.status);
-        const m = await res.json();
-        setValue('cpu_core_temp', m.cpu?.core_temperature_c, '°C');
-        setValue('cpu_hotspot_temp', m.cpu?.hotspot_temperature_c, '°C');
-        setValue('cpu_usage', m.cpu?.usage_percent, '%');
-        setValue('cpu_clock_max', m.cpu?.max_clock_mhz, 'MHz');
-        setValue('net_load', m.net?.usage_percent, '%');
-        setValue('cpu_clock_avg', m.cpu?.avg_clock_mhz, 'MHz');
-        setValue('cpu_power', m.cpu?.power_w, 'W');
-        setValue('ram_usage', m.ram?.usage_percent, '%');
-        setValue('ram_used', m.ram?.used_gb, 'GB');
-        setValue('ram_free', m.ram?.free_gb, 'GB');
-        setValue('gpu_core_temp', m.gpu?.core_temperature_c, '°C');
-        setValue('gpu_hotspot_temp', m.gpu?.hotspot_temperature_c, '°C');
-        setValue('gpu_clock', m.gpu?.core_clock_mhz, 'MHz');
-        setValue('gpu_mem_clock', m.gpu?.memory_clock_mhz, 'MHz');
-        setValue('gpu_usage', m.gpu?.usage_percent, '%');
-        setValue('gpu_power', m.gpu?.power_w, 'W');
+        const res = await fetch('/api/metrics.bin', { cache: 'no-store', signal: ctrl ? ctrl.signal : undefined });
+        if (!res.ok) {
+          // No current values (warming up, or reads failing): blank the tiles instead of freezing them
+          applyMetrics(Object.fromEntries(METRICS_BIN_KEYS.map(key => [key, null])));
+          throw new Error('HTTP ' + res.status);
+        }
+        applyMetrics(decodeMetrics(await res.arrayBuffer()));
       } catch (e) {
-        console.error(e);
+        if (!e || e.name !== 'AbortError') console.error(e);
+      } finally {
+        if (pollAbort === ctrl) pollAbort = null;
       }
     }
 
+    // Self-scheduling loop: the next request is only queued after the previous one settles,
+    // and nothing runs while the tab is hidden (visibilitychange restarts it)
+    async function pollLoop(gen){
+      pollTimer = null;
+      if (gen !== pollGen || document.hidden) return;
+      await fetchMetrics();
+      if (gen === pollGen && !document.hidden) pollTimer = setTimeout(() => pollLoop(gen), UPDATE_MS);
+    }
+
+    function stopPolling(){
+      pollGen++;
+      if (pollTimer) { clearTimeout(pollTimer); pollTimer = null; }
+      if (pollAbort) pollAbort.abort();
+    }
+
     function startPolling(){
-      if (pollTimer) clearInterval(pollTimer);
-      pollTimer = setInterval(fetchMetrics, UPDATE_MS);
+      stopPolling();
+      IS_POLLING = true;
+      pollLoop(pollGen);
+    }
+
+    // Server pushes a frame over SSE whenever a value changes; /api/metrics.bin paints the first
+    // frame right away and is polled instead when EventSource is unavailable or gets refused
+    function startStream(){
+      if (!window.EventSource) { startPolling(); return; }
+      fetchMetrics();
+      metricsSource = new EventSource('/api/metrics/stream');
+      metricsSource.onmessage = (e) => {
+        try { applyMetrics(JSON.parse(e.data)); } catch (err) { console.error(err); }
+      };
+      metricsSource.onerror = () => {
+        // CLOSED means the browser gave up (e.g. an error status); otherwise it reconnects itself
+        if (metricsSource && metricsSource.readyState === EventSource.CLOSED) {
+          metricsSource = null;
+          startPolling();
+        }
+      };
     }
 
     function openSettings(){
@@ -917,20 +1543,63 @@ def index(_request: HttpRequest) -> HttpResponse:
       const secs = parseFloat(input.value);
       if (!isNaN(secs) && secs > 0.05) {
         UPDATE_MS = Math.round(secs * 1000);
-        startPolling();
-        // Persist updated interval
-        saveConfig({ update_interval_sec: secs });
+        // The server paces the stream from the saved interval; only the polling fallback restarts
+        if (IS_POLLING) startPolling();
+        // Persist updated interval once typing settles
+        saveConfigDebounced({ update_interval_sec: secs });
+      }
+    }
+    // Value/unit spans per tile key; reordering re-parents tiles, so references stay valid
+    let TILES = null;
+    let GRID = null;
+    function buildGrid(){
+      const tpl = document.getElementById('tile-tpl');
+      const frag = document.createDocumentFragment();
+      for (const [key, unit, label] of TILES_META) {
+        const item = tpl.content.firstElementChild.cloneNode(true);
+        item.dataset.key = key;
+        const valueEl = item.querySelector('.value');
+        valueEl.id = key;
+        valueEl.querySelector('.unit').textContent = unit;
+        item.querySelector('.label-below').textContent = label;
+        frag.appendChild(item);
       }
+      GRID.replaceChildren(frag);
+    }
+    function buildTileCache(){
+      TILES = {};
+      document.querySelectorAll('.grid .item').forEach(el => {
+        const valueEl = el.querySelector('.value');
+        if (valueEl) TILES[el.dataset.key] = {
+          v: valueEl.querySelector('.v'), unit: valueEl.querySelector('.unit'), kind: UNIT_KIND[el.dataset.key] | 0,
+        };
+      });
     }
     function setValue(id, value, unit) {
-      const el = document.getElementById(id);
-      if (!el) return;
+      const t = TILES && TILES[id];
+      if (!t) return;
       const v = (value === null || value === undefined) ? '—' : value.toString();
-      const vEl = el.querySelector('.v');
-      vEl.textContent = v;
       // Color only the numeric part using the selected colormap for °C and %
-      vEl.style.color = valueToColor(value, unit);
-      el.querySelector('.unit').textContent = unit || '';
+      const scale = valueToScale(value, t.kind);
+      // Skip DOM writes (and the style/paint work they trigger) when nothing changed
+      if (t._lastV !== v) {
+        t._lastV = v;
+        t.v.textContent = v;
+      }
+      if (t._lastT !== scale) {
+        t._lastT = scale;
+        if (scale === null) {
+          t.v.classList.remove('scaled');
+        } else {
+          t.v.style.setProperty('--t', scale);
+          t.v.classList.add('scaled');
+        }
+      }
+      const u = unit || '';
+      if (t._lastU !== u) {
+        t._lastU = u;
+        t.unit.textContent = u;
+      }
     }
     // --- Reorder & Config persistence ---
     function getCurrentOrder(){
@@ -938,7 +1607,8 @@ def index(_request: HttpRequest) -> HttpResponse:
     }
     async function loadConfig(){
       try {
-        const res = await fetch('/api/config', { cache: 'no-store' });
+        // Revalidate instead of bypassing the cache, so an unchanged config comes back as a 304
+        const res = await fetch('/api/config', { cache: 'no-cache' });
         if (res.ok) {
           const c = await res.json();
           if (Array.isArray(c.order)) applyOrder(c.order);
@@ -951,19 +1621,18 @@ def index(_request: HttpRequest) -> HttpResponse:
       } catch {}
     }
     function applyOrder(order){
-      const grid = document.querySelector('.grid');
-      if (!grid || !order) return;
-      const map = new Map(Array.from(grid.children).map(el => [el.dataset.key, el]));
+      if (!GRID || !order) return;
+      const map = new Map(Array.from(GRID.children).map(el => [el.dataset.key, el]));
       order.forEach(key => {
         const el = map.get(key);
-        if (el) grid.appendChild(el);
+        if (el) GRID.appendChild(el);
       });
     }
     async function saveConfig(partial){
-      const payload = Object.assign({
-        order: getCurrentOrder(),
-        update_interval_sec: UPDATE_MS / 1000,
-      }, partial || {});
+      const payload = {
+        order: partial?.order ?? getCurrentOrder(),
+        update_interval_sec: partial?.update_interval_sec ?? UPDATE_MS / 1000,
+      };
       try {
         await fetch('/api/config', {
           method: 'POST',
@@ -972,18 +1641,48 @@ def index(_request: HttpRequest) -> HttpResponse:
         });
       } catch {}
     }
+    // Trailing-edge debounce: typing "1.25" posts once instead of once per keystroke
+    let saveTimer = null;
+    function saveConfigDebounced(partial){
+      clearTimeout(saveTimer);
+      saveTimer = setTimeout(() => { saveTimer = null; saveConfig(partial); }, 300);
+    }
     function toggleReorder(){
       IS_REORDER = !IS_REORDER;
       document.body.classList.toggle('reorder', IS_REORDER);
     }
     function setupDrag(){
-      const grid = document.querySelector('.grid');
-      if (!grid) return;
-      grid.querySelectorAll('.item').forEach(item => {
+      if (!GRID) return;
+      GRID.querySelectorAll('.item').forEach(item => {
         item.addEventListener('pointerdown', onPointerDown);
       });
     }
     let dragEl = null; let placeholder = null; let offsetX = 0; let offsetY = 0;
+    // Tiles (minus the dragged one and the placeholder) and their rects, captured at drag start;
+    // rects are re-read only after the placeholder moves, since nothing else reflows mid-drag
+    let dragItems = []; let dragRects = [];
+    // Grid geometry cached at drag start; tiles are bucketed by row so moveTo only measures
+    // the row under the pointer (rows share one height thanks to grid-auto-rows: 1fr)
+    let gridTop = 0; let rowPitch = 1; let dragRows = [];
+    // Raw pointer updates (where supported) are folded into one moveTo per animation frame
+    const MOVE_EVENT = ('onpointerrawupdate' in window) ? 'pointerrawupdate' : 'pointermove';
+    let moveFrame = 0; let moveX = 0; let moveY = 0;
+    function measureGrid(){
+      const g = GRID.getBoundingClientRect();
+      const style = getComputedStyle(GRID);
+      const rows = style.gridTemplateRows.split(' ').filter(Boolean).length || 1;
+      const rowGap = parseFloat(style.rowGap) || 0;
+      gridTop = g.top;
+      rowPitch = Math.max(1, (g.height + rowGap) / rows);
+    }
+    function snapshotDragRects(){
+      dragRects = dragItems.map(el => el.getBoundingClientRect());
+      dragRows = [];
+      dragRects.forEach((r, i) => {
+        const row = Math.max(0, Math.floor((r.top + r.height / 2 - gridTop) / rowPitch));
+        (dragRows[row] || (dragRows[row] = [])).push(i);
+      });
+    }
     function onPointerDown(e){
       if (!IS_REORDER) return;
       const item = e.currentTarget;
@@ -1000,48 +1699,68 @@ def index(_request: HttpRequest) -> HttpResponse:
       item.style.top = rect.top + 'px';
       item.style.width = rect.width + 'px';
       item.style.pointerEvents = 'none';
-      document.addEventListener('pointermove', onPointerMove);
+      dragItems = Array.from(GRID.children).filter(el => el !== dragEl && el !== placeholder);
+      measureGrid();
+      snapshotDragRects();
+      // Placement uses the cached rects, so the tiles need no hit-testing while dragging
+      GRID.style.pointerEvents = 'none';
+      document.addEventListener(MOVE_EVENT, onPointerMove);
       document.addEventListener('pointerup', onPointerUp, { once: true });
       e.preventDefault();
     }
     function onPointerMove(e){
       if (!dragEl) return;
-      moveTo(e.clientX, e.clientY);
+      const evs = e.getCoalescedEvents ? e.getCoalescedEvents() : [];
+      const last = evs.length ? evs[evs.length - 1] : e;
+      moveX = last.clientX; moveY = last.clientY;
+      if (!moveFrame) moveFrame = requestAnimationFrame(flushMove);
+    }
+    function flushMove(){
+      moveFrame = 0;
+      moveTo(moveX, moveY);
     }
     function moveTo(x, y){
       if (!dragEl) return;
       dragEl.style.left = (x - offsetX) + 'px';
       dragEl.style.top = (y - offsetY) + 'px';
-      const grid = document.querySelector('.grid');
-      const items = Array.from(grid.querySelectorAll('.item')).filter(el => el !== dragEl && el !== placeholder);
-      let nearest = null; let nearestDist = Infinity;
-      items.forEach(el => {
-        const r = el.getBoundingClientRect();
+      let nearest = -1; let nearestDist = Infinity;
+      const row = Math.min(dragRows.length - 1, Math.max(0, Math.floor((y - gridTop) / rowPitch)));
+      const candidates = dragRows[row] || dragRects.map((_, i) => i);
+      for (const i of candidates){
+        const r = dragRects[i];
         const cx = r.left + r.width / 2; const cy = r.top + r.height / 2;
         const dx = cx - x; const dy = cy - y; const d = dx*dx + dy*dy;
-        if (d < nearestDist){ nearestDist = d; nearest = el; }
-      });
-      if (nearest){
-        const r = nearest.getBoundingClientRect();
+        if (d < nearestDist){ nearestDist = d; nearest = i; }
+      }
+      if (nearest >= 0){
+        const el = dragItems[nearest]; const r = dragRects[nearest];
         const before = y < r.top + r.height / 2;
-        nearest.parentNode.insertBefore(placeholder, before ? nearest : nearest.nextSibling);
+        const ref = before ? el : el.nextSibling;
+        if (ref !== placeholder && placeholder.nextSibling !== ref){
+          GRID.insertBefore(placeholder, ref);
+          snapshotDragRects();
+        }
       }
     }
     function onPointerUp(){
-      document.removeEventListener('pointermove', onPointerMove);
+      document.removeEventListener(MOVE_EVENT, onPointerMove);
+      if (moveFrame) { cancelAnimationFrame(moveFrame); moveFrame = 0; }
+      if (GRID) GRID.style.pointerEvents = '';
       if (!dragEl || !placeholder) { dragEl = null; placeholder = null; return; }
       placeholder.parentNode.insertBefore(dragEl, placeholder);
       dragEl.classList.remove('dragging');
       dragEl.style.position = ''; dragEl.style.left = ''; dragEl.style.top = ''; dragEl.style.width = ''; dragEl.style.pointerEvents = '';
       placeholder.parentNode.removeChild(placeholder);
-      dragEl = null; placeholder = null;
+      dragEl = null; placeholder = null; dragItems = []; dragRects = []; dragRows = [];
       saveConfig({ order: getCurrentOrder() });
     }
 
     window.addEventListener('load', async () => {
+      GRID = document.querySelector('.grid');
+      buildGrid();
+      buildTileCache();
       await loadConfig();
-      fetchMetrics();
-      startPolling();
+      startStream();
       setupDrag();
       document.body.addEventListener('click', onFirstInteract, { once: true });
       document.body.addEventListener('touchstart', onFirstInteract, { once: true });
@@ -1058,6 +1777,7 @@ def index(_request: HttpRequest) -> HttpResponse:
       applyViewportFix();
       updateFSButtonVisibility();
       document.addEventListener('visibilitychange', updateFSButtonVisibility);
+      document.addEventListener('visibilitychange', () => { if (IS_POLLING && !document.hidden) startPolling(); });
       // ensure correct initial state
       syncWakeLockWithFullscreen();
       // overlay close on backdrop click
@@ -1084,42 +1804,92 @@ def index(_request: HttpRequest) -> HttpResponse:
         </div>
       </div>
     </div>
-    <div class="grid">
-      <div class="item" data-key="cpu_core_temp"><div class="value" id="cpu_core_temp"><span class="v">—</span><span class="unit">°C</span></div><div class="label-below">CPU Core Temp</div></div>
-      <div class="item" data-key="cpu_hotspot_temp"><div class="value" id="cpu_hotspot_temp"><span class="v">—</span><span class="unit">°C</span></div><div class="label-below">CPU Hot Spot</div></div>
-      <div class="item" data-key="cpu_usage"><div class="value" id="cpu_usage"><span class="v">—</span><span class="unit">%</span></div><div class="label-below">CPU Usage</div></div>
-      <div class="item" data-key="cpu_clock_max"><div class="value" id="cpu_clock_max"><span class="v">—</span><span class="unit">MHz</span></div><div class="label-below">CPU Max Clock</div></div>
-      <div class="item" data-key="net_load"><div class="value" id="net_load"><span class="v">—</span><span class="unit">%</span></div><div class="label-below">Network Load</div></div>
-      <div class="item" data-key="cpu_clock_avg"><div class="value" id="cpu_clock_avg"><span class="v">—</span><span class="unit">MHz</span></div><div class="label-below">CPU Avg Clock</div></div>
-      <div class="item" data-key="cpu_power"><div class="value" id="cpu_power"><span class="v">—</span><span class="unit">W</span></div><div class="label-below">CPU Power</div></div>
-
-      <div class="item" data-key="ram_usage"><div class="value" id="ram_usage"><span class="v">—</span><span class="unit">%</span></div><div class="label-below">RAM Usage</div></div>
-      <div class="item" data-key="ram_used"><div class="value" id="ram_used"><span class="v">—</span><span class="unit">GB</span></div><div class="label-below">RAM Used</div></div>
-      <div class="item" data-key="ram_free"><div class="value" id="ram_free"><span class="v">—</span><span class="unit">GB</span></div><div class="label-below">RAM Free</div></div>
-
-      <div class="item" data-key="gpu_core_temp"><div class="value" id="gpu_core_temp"><span class="v">—</span><span class="unit">°C</span></div><div class="label-below">GPU Core Temp</div></div>
-      <div class="item" data-key="gpu_hotspot_temp"><div class="value" id="gpu_hotspot_temp"><span class="v">—</span><span class="unit">°C</span></div><div class="label-below">GPU Hot Spot</div></div>
-      <div class="item" data-key="gpu_clock"><div class="value" id="gpu_clock"><span class="v">—</span><span class="unit">MHz</span></div><div class="label-below">GPU Clock</div></div>
-      <div class="item" data-key="gpu_mem_clock"><div class="value" id="gpu_mem_clock"><span class="v">—</span><span class="unit">MHz</span></div><div class="label-below">GPU Mem Clock</div></div>
-      <div class="item" data-key="gpu_usage"><div class="value" id="gpu_usage"><span class="v">—</span><span class="unit">%</span></div><div class="label-below">GPU Usage</div></div>
-      <div class="item" data-key="gpu_power"><div class="value" id="gpu_power"><span class="v">—</span><span class="unit">W</span></div><div class="label-below">GPU Power</div></div>
-    </div>
+    <template id="tile-tpl"><div class="item"><div class="value"><span class="v">—</span><span class="unit"></span></div><div class="label-below"></div></div></template>
+    <div class="grid"></div>
   </div>
 </body>
 </html>
-    """
-    return HttpResponse(html)
+    """.replace("__METRICS_BIN_KEYS__", json.dumps(list(METRICS_BIN_KEYS)))
+
+# The page is static; encode, compress and fingerprint it once instead of per request
+_INDEX_BYTES = INDEX_HTML.encode("utf-8")
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, 9)
+_INDEX_HASH = hashlib.sha256(_INDEX_BYTES).hexdigest()[:32]
+_INDEX_ETAG = f'"{_INDEX_HASH}"'
+_INDEX_ETAG_GZ = f'"{_INDEX_HASH}-gz"'
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # Honor q-values: "gzip;q=0" refuses gzip, and "*" covers gzip when it is not listed
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def index(request: HttpRequest) -> HttpResponse:
+    use_gzip = _accepts_gzip(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    etag = _INDEX_ETAG_GZ if use_gzip else _INDEX_ETAG
+    if _etag_matches(request.META.get("HTTP_IF_NONE_MATCH", ""), etag):
+        response: HttpResponse = HttpResponseNotModified()
+    elif use_gzip:
+        response = HttpResponse(_INDEX_GZ, content_type="text/html; charset=utf-8")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(_INDEX_BYTES, content_type="text/html; charset=utf-8")
+    response["ETag"] = etag
+    response["Cache-Control"] = "public, max-age=3600"
+    response["Vary"] = "Accept-Encoding"
+    return response
 
 
 urlpatterns = [
     path("", index),
     path("api/metrics", metrics_json),
+    path("api/metrics.bin", metrics_bin),
+    path("api/metrics/stream", metrics_stream),
     path("api/config", config_view),
 ]
 
 
+_django_app: Optional[Callable[..., Any]] = None
+
+
+def wsgi_application(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+    # /api/metrics(.bin) are pre-encoded blobs; serve them without URL routing or response objects
+    path_info = environ.get("PATH_INFO")
+    if path_info in ("/api/metrics", "/api/metrics.bin") and environ.get("REQUEST_METHOD") == "GET":
+        binary = path_info == "/api/metrics.bin"
+        with _metrics_lock:
+            body = _latest_bin if binary else _latest_bytes
+        if body is not None:
+            start_response("200 OK", [
+                ("Content-Type", "application/octet-stream" if binary else "application/json"),
+                ("Content-Length", str(len(body))),
+            ])
+            return [body]
+    # Errors and warm-up responses for the metrics endpoints still come from the Django views
+    global _django_app
+    if _django_app is None:
+        from django.core.wsgi import get_wsgi_application  # type: ignore
+        _django_app = get_wsgi_application()
+    return _django_app(environ, start_response)
+
+
 def main() -> None:
-    global ohm_reader
+    global _reader_dll_path
     global UI_CONFIG
     parser = argparse.ArgumentParser(description="LibreHardwareMonitor Django server")
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind (default: 0.0.0.0)")
@@ -1137,7 +1907,9 @@ def main() -> None:
     except Exception:
         UI_CONFIG = {"order": SENSOR_KEYS_DEFAULT.copy(), "update_interval_sec": 1.0}
 
-    ohm_reader = CompositeMetricsReader(dll_path=args.lhm_dll)
+    # LHM is loaded by the refresh thread in the background; see get_reader()
+    _reader_dll_path = args.lhm_dll
+    start_metrics_refresher()
 
     configure_django()
 
@@ -1215,15 +1987,18 @@ def main() -> None:
     # If cert and key provided, serve via HTTPS using a simple WSGI server; optionally also start HTTP on --http-port
     if args.cert_path and args.key_path:
         try:
-            from wsgiref.simple_server import make_server  # type: ignore
-            from django.core.wsgi import get_wsgi_application  # type: ignore
+            from socketserver import ThreadingMixIn
+            from wsgiref.simple_server import WSGIServer, make_server  # type: ignore
             import ssl
-            import threading
 
-            application = get_wsgi_application()
+            class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+                # One thread per connection so open event streams do not block other clients
+                daemon_threads = True
+
+            application = wsgi_application
 
             def _serve_https() -> None:
-                httpsd = make_server(args.host, int(args.port), application)
+                httpsd = make_server(args.host, int(args.port), application, server_class=ThreadingWSGIServer)
                 context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
                 context.load_cert_chain(certfile=args.cert_path, keyfile=args.key_path)
                 httpsd.socket = context.wrap_socket(httpsd.socket, server_side=True)
@@ -1237,7 +2012,7 @@ def main() -> None:
 
             if args.http_port:
                 def _serve_http() -> None:
-                    httpd = make_server(args.host, int(args.http_port), application)
+                    httpd = make_server(args.host, int(args.http_port), application, server_class=ThreadingWSGIServer)
                     print(f"Serving HTTP on http://{args.host}:{args.http_port}")
                     httpd.serve_forever()
                 t_http = threading.Thread(target=_serve_http, daemon=True)